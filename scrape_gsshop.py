@@ -32,16 +32,60 @@ network inspector.
 from __future__ import annotations
 
 import argparse
+import asyncio
+import csv
+import importlib.util
 import logging
 import time
-from dataclasses import dataclass, asdict
-from typing import Dict, Iterable, List, Optional
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import closing
+from dataclasses import dataclass, fields
+from email.utils import parsedate_to_datetime
+from operator import attrgetter
+from typing import (
+    AsyncGenerator,
+    Dict,
+    Generator,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Type,
+    TypeVar,
+)
 
-import pandas as pd
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util import Retry
+
+try:
+    import httpx
+except ImportError:  # pragma: no cover - exercised only without httpx
+    httpx = None
+
+_HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+"""Whether httpx can negotiate HTTP/2 (it needs the optional ``h2`` package)."""
+
+try:
+    from orjson import loads as _json_loads
+except ImportError:  # pragma: no cover - exercised only without orjson
+    from json import loads as _json_loads
 
 LOGGER = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
+_Batch = Tuple[range, List[List[Dict[str, object]]]]
+"""Pages requested in one batch and the raw product entries of each page."""
+
+_HTTP_ERRORS: Tuple[Type[BaseException], ...] = (requests.HTTPError,)
+_NETWORK_ERRORS: Tuple[Type[BaseException], ...] = (requests.RequestException,)
+if httpx is not None:
+    _HTTP_ERRORS += (httpx.HTTPStatusError,)
+    _NETWORK_ERRORS += (httpx.HTTPError,)
+
 
 AUTO_BASE_URL_TOKEN = "auto"
 """Sentinel value instructing the scraper to probe known public APIs."""
@@ -62,6 +106,31 @@ the need to capture a request manually from the browser developer tools.
 BASE_URL = DEFAULT_BASE_URLS[0]
 """Default endpoint used when a specific URL is supplied."""
 
+DEFAULT_CONCURRENCY = 10
+"""Number of pages requested in parallel within a single batch.
+
+The same value caps the httpx connection pool and, when httpx is not
+installed, the thread pool that drives :func:`fetch_products`.
+"""
+
+REQUEST_TIMEOUT_SECONDS = 10
+"""Total timeout applied to each page request."""
+
+HTTP_POOL_SIZE = 32
+"""Connections kept alive per host by the shared :data:`_SESSION`."""
+
+RETRY_STATUS_CODES = (429, 500, 502, 503, 504)
+"""Response statuses that are retried with exponential backoff."""
+
+MAX_RETRIES = 5
+"""Maximum number of retries per page request."""
+
+RETRY_BACKOFF_FACTOR = 0.5
+"""Base delay in seconds, doubled after every failed attempt.
+
+A ``Retry-After`` header sent by the server takes precedence.
+"""
+
 DEFAULT_CATEGORY_ID = "1548240"
 """Category identifier for the GS Shop liquor section."""
 
@@ -93,6 +162,31 @@ extend them for their own environment.
 """
 
 
+def _build_session() -> requests.Session:
+    """Return a :class:`requests.Session` with pooled, retrying adapters."""
+
+    session = requests.Session()
+    session.headers.update(DEFAULT_HEADERS)
+    adapter = HTTPAdapter(
+        pool_connections=HTTP_POOL_SIZE,
+        pool_maxsize=HTTP_POOL_SIZE,
+        max_retries=Retry(
+            total=MAX_RETRIES,
+            backoff_factor=RETRY_BACKOFF_FACTOR,
+            status_forcelist=RETRY_STATUS_CODES,
+            respect_retry_after_header=True,
+            raise_on_status=False,
+        ),
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+_SESSION = _build_session()
+"""Module-wide session so connections are reused across page requests."""
+
+
 def resolve_candidate_base_urls(value: str) -> List[str]:
     """Return the ordered list of endpoints the scraper should try."""
 
@@ -101,55 +195,255 @@ def resolve_candidate_base_urls(value: str) -> List[str]:
     return [value]
 
 
-def _collect_from_single_base(
+def _iter_from_single_base(
     *,
     target_count: int,
     page_size: int,
     delay_seconds: float,
+    concurrency: int,
     headers: Optional[Dict[str, str]],
     base_url: str,
     params: Dict[str, object],
-) -> List[Product]:
-    """Collect products using ``base_url`` until ``target_count`` is met."""
-
-    items: Dict[str, Product] = {}
-    page = 1
-    session = requests.Session()
+    seen: Set[str],
+) -> Iterator[List[Product]]:
+    """Yield new products from ``base_url`` page by page.
+
+    Pages are requested in batches of ``concurrency`` so that the total
+    wall time is bounded by the slowest response of each batch rather than
+    the sum of all round trips.  ``delay_seconds`` adds an optional pause
+    between batches; rate limiting is otherwise handled by retrying with
+    backoff (see :data:`RETRY_STATUS_CODES`).  httpx is used when it is
+    installed; otherwise the batches are fanned out over a thread pool
+    sharing :data:`_SESSION`.
+
+    ``seen`` holds the IDs already collected (possibly from a previous
+    endpoint) so that duplicates are skipped before a :class:`Product` is
+    built for them.  Iteration stops once ``seen`` reaches
+    ``target_count`` or an empty page is encountered.
+    """
 
-    while len(items) < target_count:
-        products = fetch_products(
-            page=page,
+    batches: Generator[_Batch, None, None]
+    if httpx is None:
+        batches = _fetch_batches_with_threads(
             page_size=page_size,
+            delay_seconds=delay_seconds,
+            concurrency=concurrency,
             headers=headers,
-            session=session,
             base_url=base_url,
-            **params,
+            params=params,
+        )
+    else:
+        batches = _iterate_async(
+            _fetch_batches_with_httpx(
+                page_size=page_size,
+                delay_seconds=delay_seconds,
+                concurrency=concurrency,
+                headers=headers,
+                base_url=base_url,
+                params=params,
+            )
         )
 
-        if not products:
-            LOGGER.info("No products returned for page %s; stopping.", page)
-            break
+    initial_count = len(seen)
+    with closing(batches):
+        for pages, results in batches:
+            finished = False
+            for current_page, entries in zip(pages, results):
+                if not entries:
+                    LOGGER.info(
+                        "No products returned for page %s; stopping.", current_page
+                    )
+                    finished = True
+                    break
+
+                products = _new_products(entries, seen)
+                LOGGER.info(
+                    "Collected %s/%s products after page %s",
+                    len(seen),
+                    target_count,
+                    current_page,
+                )
+                if products:
+                    yield products
+                if len(seen) >= target_count:
+                    finished = True
+                    break
 
-        for product in products:
-            items.setdefault(product.id, product)
+            if finished:
+                break
 
-        LOGGER.info(
-            "Collected %s/%s products after page %s",
-            len(items),
-            target_count,
-            page,
-        )
+    LOGGER.info(
+        "Finished scraping %s products from %s", len(seen) - initial_count, base_url
+    )
 
-        page += 1
-        time.sleep(delay_seconds)
 
-    LOGGER.info(
-        "Finished scraping %s products from %s", len(items), base_url
+async def _fetch_batches_with_httpx(
+    *,
+    page_size: int,
+    delay_seconds: float,
+    concurrency: int,
+    headers: Optional[Dict[str, str]],
+    base_url: str,
+    params: Dict[str, object],
+) -> AsyncGenerator[_Batch, None]:
+    """Asynchronous backend for :func:`_iter_from_single_base`.
+
+    Yields ``(pages, results)`` for consecutive batches until the consumer
+    stops iterating.  When ``h2`` is installed the client negotiates HTTP/2
+    so that every page of a batch is sent as a separate stream over one TLS
+    connection.  Without ``h2``, or for servers that only speak HTTP/1.1,
+    requests use a pool of up to ``concurrency`` connections.
+    """
+
+    page = 1
+    limits = httpx.Limits(
+        max_connections=concurrency, max_keepalive_connections=concurrency
     )
-    return list(items.values())
 
+    async with httpx.AsyncClient(
+        http2=_HTTP2_AVAILABLE,
+        headers=DEFAULT_HEADERS,
+        limits=limits,
+        timeout=REQUEST_TIMEOUT_SECONDS,
+    ) as client:
+        while True:
+            pages = range(page, page + concurrency)
+            # A TaskGroup cancels the rest of the batch as soon as one page
+            # fails, so no request outlives the client or the event loop.
+            try:
+                async with asyncio.TaskGroup() as group:
+                    tasks = [
+                        group.create_task(
+                            _fetch_product_entries_async(
+                                client,
+                                page=current_page,
+                                page_size=page_size,
+                                headers=headers,
+                                base_url=base_url,
+                                **params,
+                            )
+                        )
+                        for current_page in pages
+                    ]
+            except ExceptionGroup as errors:
+                # Surface the first page error itself so callers can keep
+                # catching the plain httpx/requests exception types.
+                raise errors.exceptions[0] from None
+            yield pages, [task.result() for task in tasks]
+
+            page += concurrency
+            if delay_seconds > 0:
+                await asyncio.sleep(delay_seconds)
+
+
+def _fetch_batches_with_threads(
+    *,
+    page_size: int,
+    delay_seconds: float,
+    concurrency: int,
+    headers: Optional[Dict[str, str]],
+    base_url: str,
+    params: Dict[str, object],
+) -> Generator[_Batch, None, None]:
+    """Thread-pool backend for :func:`_iter_from_single_base`.
+
+    ``requests`` releases the GIL while waiting on sockets, so a pool of
+    ``concurrency`` workers sharing :data:`_SESSION` overlaps the round
+    trips much like the httpx backend does.
+    """
+
+    page = 1
 
-@dataclass
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        while True:
+            pages = range(page, page + concurrency)
+            futures = {
+                executor.submit(
+                    _fetch_product_entries,
+                    page=current_page,
+                    page_size=page_size,
+                    headers=headers,
+                    session=_SESSION,
+                    base_url=base_url,
+                    **params,
+                ): current_page
+                for current_page in pages
+            }
+            results: Dict[int, List[Dict[str, object]]] = {}
+            for future in as_completed(futures):
+                results[futures[future]] = future.result()
+
+            yield pages, [results[current_page] for current_page in pages]
+
+            page += concurrency
+            if delay_seconds > 0:
+                time.sleep(delay_seconds)
+
+
+def _iterate_async(iterator: AsyncGenerator[T, None]) -> Generator[T, None, None]:
+    """Drive an asynchronous generator from synchronous code.
+
+    A private event loop is kept alive between items so that the async
+    backend (and its open connections) survives while the caller
+    processes each batch.  If the loop is interrupted (for example by
+    Ctrl-C) while an item is in flight, the pending step is cancelled and
+    drained before the generator is closed, so its cleanup runs and the
+    original exception propagates.
+    """
+
+    loop = asyncio.new_event_loop()
+    pending: Optional[asyncio.Future] = None
+    try:
+        while True:
+            pending = asyncio.ensure_future(iterator.__anext__(), loop=loop)
+            try:
+                item = loop.run_until_complete(pending)
+            except StopAsyncIteration:
+                return
+            yield item
+    finally:
+        if pending is not None and not pending.done():
+            pending.cancel()
+            try:
+                loop.run_until_complete(pending)
+            except (asyncio.CancelledError, Exception):
+                pass
+        try:
+            loop.run_until_complete(iterator.aclose())
+            loop.run_until_complete(loop.shutdown_asyncgens())
+        finally:
+            loop.close()
+
+
+def _new_products(
+    entries: Iterable[Dict[str, object]], seen: Set[str]
+) -> List[Product]:
+    """Return products from ``entries`` whose IDs are not yet in ``seen``.
+
+    IDs of the returned products are added to ``seen``.  The method lookups
+    are bound once because this loop runs for every row of every page.
+    """
+
+    products: List[Product] = []
+    append = products.append
+    mark_seen = seen.add
+    from_payload = Product.from_payload
+    for raw in entries:
+        product_id = _product_id(raw)
+        if product_id in seen:
+            continue
+        try:
+            product = from_payload(raw)
+        except ValueError as exc:
+            LOGGER.debug("Skipping product due to schema issue: %s", exc)
+            continue
+        mark_seen(product_id)
+        append(product)
+
+    return products
+
+
+@dataclass(slots=True)
 class Product:
     """Represents a single product extracted from the GS Shop API."""
 
@@ -169,73 +463,91 @@ class Product:
         directly on the product object).
         """
 
-        goods_no = str(
-            payload.get("goodsNo")
-            or payload.get("goodsId")
-            or payload.get("itemId")
-            or payload.get("id")
-        )
+        goods_no = _product_id(payload)
         if not goods_no:
             raise ValueError("Unable to determine product ID from payload")
 
-        name = str(
-            payload.get("goodsNm")
-            or payload.get("goodsNm1")
-            or payload.get("goodsName")
-            or payload.get("productName")
-            or payload.get("name")
-            or payload.get("title")
-            or ""
+        get = payload.get
+
+        name = (
+            get("goodsNm")
+            or get("goodsNm1")
+            or get("goodsName")
+            or get("productName")
+            or get("name")
+            or get("title")
         )
         if not name:
             raise ValueError(
                 f"Product {goods_no!r} is missing a name: {payload!r}"
             )
-
-        price_candidates = [
-            payload.get("sellPrice"),
-            payload.get("salePrice"),
-            payload.get("goodsPrice"),
-            payload.get("price"),
-            payload.get("finalPrice"),
-        ]
-
-        price_info = payload.get("price") or {}
-        if isinstance(price_info, dict):
-            price_candidates.extend(
-                price_info.get(key)
-                for key in (
-                    "sellPrice",
-                    "salePrice",
-                    "bestPrice",
-                    "goodsPrice",
-                    "value",
-                )
-            )
-
-        price_info_alt = payload.get("priceInfo") or {}
-        if isinstance(price_info_alt, dict):
-            price_candidates.extend(price_info_alt.values())
-
-        sell_price = _normalize_price(price_candidates)
-
-        detail_url = str(
-            payload.get("detailUrl")
-            or payload.get("url")
-            or payload.get("goodsDetailUrl")
-            or payload.get("pcDetailUrl")
-            or payload.get("itemDetailUrl")
-            or payload.get("detail")
-            or payload.get("linkUrl")
-            or ""
+        if type(name) is not str:
+            name = str(name)
+
+        sell_price = _normalize_price(_iter_price_candidates(payload))
+
+        detail_url = (
+            get("detailUrl")
+            or get("url")
+            or get("goodsDetailUrl")
+            or get("pcDetailUrl")
+            or get("itemDetailUrl")
+            or get("detail")
+            or get("linkUrl")
         )
-
         if not detail_url:
             detail_url = DETAIL_URL_TEMPLATE.format(goods_no=goods_no)
+        elif type(detail_url) is not str:
+            detail_url = str(detail_url)
 
         return cls(id=goods_no, name=name, price=sell_price, url=detail_url)
 
 
+CSV_FIELDNAMES = tuple(field.name for field in fields(Product))
+"""Column order of the exported CSV file."""
+
+_csv_row = attrgetter(*CSV_FIELDNAMES)
+"""Return the CSV row of a :class:`Product` as a tuple of its fields."""
+
+
+def _product_id(payload: Dict[str, object]) -> str:
+    """Return the product ID of a raw payload, or ``""`` when it has none."""
+
+    get = payload.get
+    goods_no = get("goodsNo") or get("goodsId") or get("itemId") or get("id")
+    if not goods_no:
+        return ""
+    return goods_no if type(goods_no) is str else str(goods_no)
+
+
+def _iter_price_candidates(payload: Dict[str, object]) -> Iterator[object]:
+    """Yield price-like values from ``payload`` in order of preference.
+
+    Candidates are produced lazily so that :func:`_normalize_price` stops
+    reading the payload as soon as a usable price is found.
+    """
+
+    get = payload.get
+    price_info = get("price")
+
+    yield get("sellPrice")
+    yield get("salePrice")
+    yield get("goodsPrice")
+    yield price_info
+    yield get("finalPrice")
+
+    if price_info and isinstance(price_info, dict):
+        yield price_info.get("sellPrice")
+        yield price_info.get("salePrice")
+        yield price_info.get("bestPrice")
+        yield price_info.get("goodsPrice")
+        yield price_info.get("value")
+
+    price_info_alt = get("priceInfo")
+    if price_info_alt and isinstance(price_info_alt, dict):
+        yield from price_info_alt.values()
+
+
 def fetch_products(
     page: int,
     page_size: int,
@@ -255,10 +567,13 @@ def fetch_products(
         Number of products per page.  The category UI typically renders
         60 items per batch, which is used as the default.
     headers:
-        HTTP headers to use when making the request.  When ``None``,
-        :data:`DEFAULT_HEADERS` are used.
+        Request-specific HTTP headers.  They are merged over the session's
+        own headers, which for the default session are
+        :data:`DEFAULT_HEADERS`.
     session:
-        Optional :class:`requests.Session` for connection pooling.
+        Optional :class:`requests.Session` used for the request.  When
+        ``None``, the module-wide pooled :data:`_SESSION` is used so
+        connections are kept alive between pages.
     base_url:
         The product API endpoint captured from browser developer tools.
     **params:
@@ -266,21 +581,147 @@ def fetch_products(
         example ``msectid`` or ``disp_ctg_no``).
     """
 
-    request_headers = dict(DEFAULT_HEADERS)
-    if headers:
-        request_headers.update(headers)
+    return _parse_products(
+        _fetch_product_entries(
+            page,
+            page_size,
+            headers=headers,
+            session=session,
+            base_url=base_url,
+            **params,
+        )
+    )
+
+
+def _fetch_product_entries(
+    page: int,
+    page_size: int,
+    headers: Optional[Dict[str, str]] = None,
+    session: Optional[requests.Session] = None,
+    base_url: str = BASE_URL,
+    **params: object,
+) -> List[Dict[str, object]]:
+    """Fetch a page and return its raw product dicts; see :func:`fetch_products`."""
 
+    session = session or _SESSION
     query_params = {"page": page, "size": page_size, **params}
-    http = session or requests
     LOGGER.debug("Requesting %s with params %s", base_url, query_params)
-    response = http.get(base_url, headers=request_headers, params=query_params, timeout=10)
+    response = session.get(
+        base_url,
+        headers=headers,
+        params=query_params,
+        timeout=REQUEST_TIMEOUT_SECONDS,
+    )
     response.raise_for_status()
 
-    payload = response.json()
-    raw_products = _extract_product_entries(payload)
+    return _extract_product_entries(_decode_json(response.content))
+
+
+async def fetch_products_async(
+    client: httpx.AsyncClient,
+    page: int,
+    page_size: int,
+    headers: Optional[Dict[str, str]] = None,
+    base_url: str = BASE_URL,
+    **params: object,
+) -> List[Product]:
+    """Asynchronous counterpart of :func:`fetch_products`.
+
+    ``client`` is expected to carry :data:`DEFAULT_HEADERS`; ``headers``
+    only needs to contain request-specific overrides.
+    """
+
+    return _parse_products(
+        await _fetch_product_entries_async(
+            client, page, page_size, headers=headers, base_url=base_url, **params
+        )
+    )
+
+
+async def _fetch_product_entries_async(
+    client: httpx.AsyncClient,
+    page: int,
+    page_size: int,
+    headers: Optional[Dict[str, str]] = None,
+    base_url: str = BASE_URL,
+    **params: object,
+) -> List[Dict[str, object]]:
+    """Asynchronous counterpart of :func:`_fetch_product_entries`."""
+
+    query_params = {"page": page, "size": page_size, **params}
+    LOGGER.debug("Requesting %s with params %s", base_url, query_params)
+    for attempt in range(MAX_RETRIES + 1):
+        try:
+            response = await client.get(
+                base_url, headers=headers, params=query_params
+            )
+        except httpx.TransportError as exc:
+            if attempt == MAX_RETRIES:
+                raise
+            delay = _retry_delay(None, attempt)
+            LOGGER.debug(
+                "Request for page %s failed (%s); retrying in %.1fs", page, exc, delay
+            )
+            await asyncio.sleep(delay)
+            continue
+        if response.status_code not in RETRY_STATUS_CODES or attempt == MAX_RETRIES:
+            break
+        delay = _retry_delay(response.headers.get("Retry-After"), attempt)
+        LOGGER.debug(
+            "Got HTTP %s for page %s; retrying in %.1fs",
+            response.status_code,
+            page,
+            delay,
+        )
+        await asyncio.sleep(delay)
+    response.raise_for_status()
+
+    return _extract_product_entries(_decode_json(response.content))
+
+
+def _retry_delay(retry_after: Optional[str], attempt: int) -> float:
+    """Return how long to wait before retry number ``attempt + 1``.
+
+    Honours a ``Retry-After`` header given either in seconds or as an HTTP
+    date, and otherwise backs off exponentially from
+    :data:`RETRY_BACKOFF_FACTOR`.
+    """
+
+    if retry_after:
+        try:
+            return max(0.0, float(retry_after))
+        except ValueError:
+            pass
+        try:
+            retry_at = parsedate_to_datetime(retry_after)
+        except (TypeError, ValueError):
+            pass
+        else:
+            return max(0.0, retry_at.timestamp() - time.time())
+    return RETRY_BACKOFF_FACTOR * 2**attempt
+
+
+def _decode_json(content: bytes) -> object:
+    """Decode a response body, reporting non-JSON bodies as request errors.
+
+    Guessed endpoints may answer ``200`` with an HTML page.  Raising a
+    :class:`requests.RequestException` lets :func:`iter_product_batches`
+    move on to the next candidate, as ``response.json()`` used to.
+    """
+
+    try:
+        return _json_loads(content)
+    except ValueError as exc:
+        raise requests.exceptions.InvalidJSONError(
+            f"Response is not valid JSON: {exc}"
+        ) from exc
+
+
+def _parse_products(entries: Iterable[Dict[str, object]]) -> List[Product]:
+    """Convert raw product dicts into :class:`Product` instances."""
 
     products: List[Product] = []
-    for raw in raw_products:
+    for raw in entries:
         try:
             products.append(Product.from_payload(raw))
         except ValueError as exc:
@@ -341,64 +782,145 @@ def _normalize_price(candidates: Iterable[object]) -> int:
     raise ValueError("No usable price value found in payload")
 
 
-def collect_products(
+def iter_product_batches(
     target_count: int = 1000,
     page_size: int = 60,
-    delay_seconds: float = 1.0,
+    delay_seconds: float = 0.0,
     headers: Optional[Dict[str, str]] = None,
     base_urls: Optional[Iterable[str]] = None,
+    concurrency: int = DEFAULT_CONCURRENCY,
     **params: object,
-) -> List[Product]:
-    """Collect products until ``target_count`` unique items are gathered.
+) -> Iterator[List[Product]]:
+    """Yield lists of new, unique products as each page arrives.
+
+    Iteration stops once ``target_count`` unique items have been yielded
+    or the listing is exhausted, so callers can persist progress page by
+    page instead of waiting for the whole crawl.
 
     Parameters
     ----------
     base_urls:
         Ordered iterable of API endpoints to try. When ``None`` the function
         uses :data:`BASE_URL`, but the CLI passes multiple public endpoints to
-        mimic a regular storefront visitor.
+        mimic a regular storefront visitor.  If an endpoint fails part way
+        through, the next one continues from the products already yielded.
+    concurrency:
+        Number of pages fetched in parallel per batch.
     """
 
     candidates = list(base_urls or [BASE_URL])
-    last_error: Optional[Exception] = None
+    seen: Set[str] = set()
+    last_error: Optional[BaseException] = None
 
     for base_url in candidates:
         LOGGER.info("Attempting to scrape products from %s", base_url)
+        initial_count = len(seen)
         try:
-            products = _collect_from_single_base(
+            yield from _iter_from_single_base(
                 target_count=target_count,
                 page_size=page_size,
                 delay_seconds=delay_seconds,
+                concurrency=max(1, concurrency),
                 headers=headers,
                 base_url=base_url,
                 params=dict(params),
+                seen=seen,
             )
-            if products:
-                return products
-            LOGGER.warning(
-                "Endpoint %s returned no products; trying the next candidate.",
-                base_url,
-            )
-        except requests.HTTPError as exc:
+        except _HTTP_ERRORS as exc:
             last_error = exc
             LOGGER.warning("HTTP error from %s: %s", base_url, exc)
-        except requests.RequestException as exc:
+            continue
+        except _NETWORK_ERRORS as exc:
             last_error = exc
             LOGGER.warning("Network error from %s: %s", base_url, exc)
+            continue
+
+        if len(seen) > initial_count:
+            return
+        LOGGER.warning(
+            "Endpoint %s returned no products; trying the next candidate.",
+            base_url,
+        )
 
-    if last_error:
+    if last_error and not seen:
         raise last_error
 
-    return []
+
+def collect_products(
+    target_count: int = 1000,
+    page_size: int = 60,
+    delay_seconds: float = 0.0,
+    headers: Optional[Dict[str, str]] = None,
+    base_urls: Optional[Iterable[str]] = None,
+    concurrency: int = DEFAULT_CONCURRENCY,
+    **params: object,
+) -> List[Product]:
+    """Collect products until ``target_count`` unique items are gathered.
+
+    Convenience wrapper around :func:`iter_product_batches` that returns
+    the whole result at once.
+    """
+
+    return [
+        product
+        for batch in iter_product_batches(
+            target_count=target_count,
+            page_size=page_size,
+            delay_seconds=delay_seconds,
+            headers=headers,
+            base_urls=base_urls,
+            concurrency=concurrency,
+            **params,
+        )
+        for product in batch
+    ]
 
 
 def export_to_csv(products: Iterable[Product], output_path: str) -> None:
     """Persist the gathered products to ``output_path`` as CSV."""
 
-    data = [asdict(product) for product in products]
-    frame = pd.DataFrame(data)
-    frame.to_csv(output_path, index=False)
-    LOGGER.info("Saved %s products to %s", len(data), output_path)
+    count = 0
+
+    def rows() -> Iterator[Tuple[object, ...]]:
+        nonlocal count
+        for product in products:
+            count += 1
+            yield _csv_row(product)
+
+    with open(output_path, "w", newline="", encoding="utf-8") as handle:
+        writer = csv.writer(handle, lineterminator="\n")
+        writer.writerow(CSV_FIELDNAMES)
+        writer.writerows(rows())
+    LOGGER.info("Saved %s products to %s", count, output_path)
+
+
+def stream_to_csv(batches: Iterable[Iterable[Product]], output_path: str) -> int:
+    """Write product batches to ``output_path`` as they are produced.
+
+    The file is only created once the first batch arrives and is flushed
+    after every batch, so an interrupted crawl keeps the rows gathered so
+    far.  Returns the number of rows written.
+    """
+
+    count = 0
+    handle = None
+    try:
+        for batch in batches:
+            if handle is None:
+                handle = open(output_path, "w", newline="", encoding="utf-8")
+                writer = csv.writer(handle, lineterminator="\n")
+                writer.writerow(CSV_FIELDNAMES)
+            rows = list(map(_csv_row, batch))
+            writer.writerows(rows)
+            count += len(rows)
+            handle.flush()
+    finally:
+        if handle is not None:
+            handle.close()
+
+    if count:
+        LOGGER.info("Saved %s products to %s", count, output_path)
+    return count
 
 
 def parse_args() -> argparse.Namespace:
@@ -425,8 +947,20 @@ def parse_args() -> argparse.Namespace:
     parser.add_argument(
         "--delay",
         type=float,
-        default=1.0,
-        help="Delay between page requests in seconds (default: 1.0)",
+        default=0.0,
+        help=(
+            "Optional pause between batches of page requests in seconds "
+            "(default: 0). Rate-limited requests are retried with backoff."
+        ),
+    )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=DEFAULT_CONCURRENCY,
+        help=(
+            "Number of pages requested in parallel "
+            f"(default: {DEFAULT_CONCURRENCY})"
+        ),
     )
     parser.add_argument(
         "--output",
@@ -474,9 +1008,9 @@ def parse_key_value_pairs(pairs: Iterable[str]) -> Dict[str, str]:
 
     result: Dict[str, str] = {}
     for pair in pairs:
-        if "=" not in pair:
+        key, separator, value = pair.partition("=")
+        if not separator:
             raise ValueError(f"Invalid key/value pair: {pair!r}")
-        key, value = pair.split("=", 1)
         result[key] = value
     return result
 
@@ -486,6 +1020,8 @@ def main() -> None:
 
     args = parse_args()
     logging.basicConfig(level=args.log_level.upper(), format="%(message)s")
+    # httpx logs every request at INFO; keep the progress output readable.
+    logging.getLogger("httpx").setLevel(logging.WARNING)
 
     extra_params = parse_key_value_pairs(args.param)
     if not any(key in extra_params for key in CATEGORY_PARAM_KEYS):
@@ -498,23 +1034,24 @@ def main() -> None:
     candidate_base_urls = resolve_candidate_base_urls(args.base_url)
 
     try:
-        products = collect_products(
-            target_count=args.target_count,
-            page_size=args.page_size,
-            delay_seconds=args.delay,
-            headers={**DEFAULT_HEADERS, **extra_headers} if extra_headers else None,
-            base_urls=candidate_base_urls,
-            **extra_params,
+        saved = stream_to_csv(
+            iter_product_batches(
+                target_count=args.target_count,
+                page_size=args.page_size,
+                delay_seconds=args.delay,
+                concurrency=args.concurrency,
+                headers=extra_headers or None,
+                base_urls=candidate_base_urls,
+                **extra_params,
+            ),
+            args.output,
         )
-    except requests.RequestException as exc:
+    except _NETWORK_ERRORS as exc:
         LOGGER.error("Failed to collect products: %s", exc)
         return
 
-    if not products:
+    if not saved:
         LOGGER.warning("No products collected. Verify the API endpoint and parameters.")
-        return
-
-    export_to_csv(products, args.output)
 
 
 if __name__ == "__main__":